@@ -1,37 +1,127 @@
 """
 Script to build executable for Quadric Surfaces Visualizer
 Run this script to create a standalone .exe file
+
+Usage: python build_executable.py [--onefile] [--compress] [--clean] [--install-pyinstaller] [--yes]
 """
 
+import argparse
 import subprocess
 import sys
 import os
-from pathlib import Path
+
+# Flush each line as it is printed so build progress shows up immediately.
+# Some consoles (e.g. IDLE) replace stdout with an object that cannot be
+# reconfigured, or with None; those are left as they are.
+_reconfigure = getattr(sys.stdout, "reconfigure", None)
+if _reconfigure is not None:
+    _reconfigure(line_buffering=True)
+
+# Modules the visualizer never imports; keeping them out shrinks the bundle
+# and cuts the number of modules loaded at launch
+EXCLUDED_MODULES = [
+    "tkinter.test",
+    "matplotlib.tests",
+    "numpy.tests",
+    "PIL.ImageQt",
+    "setuptools",
+    "pydoc_data",
+    "unittest",
+    "pytest",
+    # Only TkAgg (and Agg for saving images) is used; drop the other GUI backends
+    "matplotlib.backends._backend_gtk",
+    "matplotlib.backends._backend_gtk3",
+    "matplotlib.backends.backend_gtk3",
+    "matplotlib.backends.backend_gtk3agg",
+    "matplotlib.backends.backend_gtk3cairo",
+    "matplotlib.backends.backend_gtk4",
+    "matplotlib.backends.backend_gtk4agg",
+    "matplotlib.backends.backend_gtk4cairo",
+    "matplotlib.backends.backend_qt",
+    "matplotlib.backends.backend_qtagg",
+    "matplotlib.backends.backend_qtcairo",
+    "matplotlib.backends.backend_qt5",
+    "matplotlib.backends.backend_qt5agg",
+    "matplotlib.backends.backend_qt5cairo",
+    "matplotlib.backends.backend_wx",
+    "matplotlib.backends.backend_wxagg",
+    "matplotlib.backends.backend_wxcairo",
+    "matplotlib.backends.backend_macosx",
+    "matplotlib.backends.backend_webagg",
+    "matplotlib.backends.backend_webagg_core",
+    "matplotlib.backends.backend_nbagg",
+    "matplotlib.backends.backend_cairo",
+    "matplotlib.backends.backend_tkcairo",
+    # GUI toolkits those backends would otherwise drag in if installed
+    "PyQt5",
+    "PyQt6",
+    "PySide2",
+    "PySide6",
+    "wx",
+    "gi",
+]
+
+# PyInstaller flags shared by every build mode
+PYINSTALLER_FLAGS = [
+    "--windowed",          # No console window
+    "--noupx",             # Never UPX-compress binaries (slow decompression at launch)
+    "--optimize=2",        # Bundle bytecode without docstrings/asserts (python -OO)
+    *(["--strip"] if sys.platform != "win32" else []),  # Strip symbols (needs strip, not on Windows)
+    "--name=QuadricSurfaces",  # Name of the executable
+    "--icon=NONE",         # No icon (you can add one later)
+    *[f"--exclude-module={name}" for name in EXCLUDED_MODULES],
+]
+
+# Default: folder build, nothing is unpacked to temp on every launch
+ONEDIR_FLAGS = [
+    "--onedir",
+    "--contents-directory=_internal",  # Keep support files out of the exe folder
+    "--debug=noarchive",   # Plain .pyc files instead of a zlib archive (onedir only)
+]
+
+# Single file for distribution; first launch has to unpack everything
+ONEFILE_FLAGS = [
+    "--onefile",
+]
 
 def check_pyinstaller():
     """Check if PyInstaller is installed"""
-    try:
-        import PyInstaller
-        print("✓ PyInstaller is installed")
-        return True
-    except ImportError:
-        print("✗ PyInstaller is not installed")
+    # find_spec only locates the package without importing it, so the check
+    # is cheap and always reflects the interpreter running the build
+    import importlib.util
+    if importlib.util.find_spec("PyInstaller") is None:
+        print("[err] PyInstaller is not installed")
         return False
+    print("[ok] PyInstaller is installed")
+    return True
 
 def install_pyinstaller():
     """Install PyInstaller"""
-    print("\n📦 Installing PyInstaller...")
+    print("\n[build] Installing PyInstaller...")
+    try:
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        pip_main = None
+    
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-        print("✓ PyInstaller installed successfully")
+        if pip_main is not None:
+            # Install in-process to skip starting another interpreter
+            if pip_main(["install", "pyinstaller"]) != 0:
+                raise subprocess.CalledProcessError(1, "pip install pyinstaller")
+        else:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        import importlib
+        importlib.invalidate_caches()  # Let the in-process build import the new package
+        print("[ok] PyInstaller installed successfully")
         return True
     except subprocess.CalledProcessError:
-        print("✗ Failed to install PyInstaller")
+        print("[err] Failed to install PyInstaller")
         return False
 
-def build_exe():
+def build_exe(onefile=False, compress=False):
     """Build the executable"""
-    print("\n🔨 Building executable...")
+    from pathlib import Path
+    print("\n[build] Building executable...")
     print("=" * 60)
     
     # Get the current directory
@@ -39,53 +129,100 @@ def build_exe():
     script_path = current_dir / "quadric_surfaces.py"
     
     if not script_path.exists():
-        print(f"✗ Error: {script_path} not found!")
+        print(f"[err] Error: {script_path} not found!")
         return False
     
-    # PyInstaller command
-    cmd = [
-        sys.executable,
-        "-m",
-        "PyInstaller",
-        "--onefile",           # Create a single executable
-        "--windowed",          # No console window
-        "--name=QuadricSurfaces",  # Name of the executable
-        "--icon=NONE",         # No icon (you can add one later)
-        "--clean",             # Clean cache
-        str(script_path)
+    # PyInstaller arguments (no --clean, so build/ caches are reused)
+    pyi_args = [
+        "--noconfirm",         # Overwrite dist/ without asking
+        f"--distpath={current_dir / 'dist'}",
+        f"--workpath={current_dir / 'build'}",
     ]
     
-    print(f"Running: {' '.join(cmd)}")
+    if onefile or compress:
+        # One-off distribution build straight from the script; its throwaway
+        # spec goes to build/ so the cached onedir spec is left untouched
+        flags = [*(ONEFILE_FLAGS if onefile else ONEDIR_FLAGS), *PYINSTALLER_FLAGS]
+        if compress:
+            flags.remove("--noupx")  # Let PyInstaller use UPX if it is on PATH
+        pyi_args += [f"--specpath={current_dir / 'build'}", *flags, str(script_path)]
+    else:
+        # Generate the .spec once and reuse it, so later builds skip re-analysis
+        spec_path = current_dir / "QuadricSurfaces.spec"
+        if not spec_path.exists():
+            makespec_cmd = [
+                sys.executable,
+                "-m",
+                "PyInstaller.utils.cliutils.makespec",
+                *ONEDIR_FLAGS,
+                *PYINSTALLER_FLAGS,
+                str(script_path)
+            ]
+            print(f"Generating spec: {' '.join(makespec_cmd)}")
+            try:
+                subprocess.check_call(makespec_cmd, cwd=str(current_dir))
+            except subprocess.CalledProcessError as e:
+                print(f"\n[err] Spec generation failed with error code {e.returncode}")
+                return False
+        else:
+            print(f"Reusing spec: {spec_path} (delete it to regenerate)")
+        pyi_args.append(str(spec_path))
+    
+    print(f"Running: PyInstaller {' '.join(pyi_args)}")
     print("=" * 60)
     
+    # Run PyInstaller in this interpreter instead of starting a second one,
+    # unless its entry point cannot be imported here
     try:
-        subprocess.check_call(cmd, cwd=str(current_dir))
+        from PyInstaller.__main__ import run as run_pyinstaller
+    except ImportError:
+        run_pyinstaller = None
+    
+    try:
+        if run_pyinstaller is not None:
+            try:
+                run_pyinstaller(pyi_args)
+            except SystemExit as e:
+                # PyInstaller reports ordinary build errors by exiting
+                if e.code not in (None, 0):
+                    print(f"\n[err] Build failed: {e.code}")
+                    return False
+        else:
+            subprocess.check_call([sys.executable, "-m", "PyInstaller", *pyi_args],
+                                  cwd=str(current_dir))
         print("\n" + "=" * 60)
-        print("✓ Build successful!")
+        print("[ok] Build successful!")
         print("=" * 60)
         
         # Find the executable
         dist_dir = current_dir / "dist"
-        exe_path = dist_dir / "QuadricSurfaces.exe"
+        if onefile:
+            exe_path = dist_dir / "QuadricSurfaces.exe"
+        else:
+            exe_path = dist_dir / "QuadricSurfaces" / "QuadricSurfaces.exe"
         
         if exe_path.exists():
-            print(f"\n📦 Executable created at:")
+            print(f"\n[build] Executable created at:")
             print(f"   {exe_path}")
-            print(f"\n📊 File size: {exe_path.stat().st_size / (1024*1024):.2f} MB")
+            print(f"\n[info] File size: {exe_path.stat().st_size / (1024*1024):.2f} MB")
         
         return True
         
     except subprocess.CalledProcessError as e:
-        print(f"\n✗ Build failed with error code {e.returncode}")
+        print(f"\n[err] Build failed with error code {e.returncode}")
         return False
     except Exception as e:
-        print(f"\n✗ Unexpected error: {e}")
+        print(f"\n[err] Unexpected error: {e}")
         return False
 
-def cleanup():
-    """Ask user if they want to clean up build files"""
+def cleanup(ask=True):
+    """Remove build files, asking the user first unless ask is False"""
+    from pathlib import Path
     print("\n" + "=" * 60)
-    response = input("🗑️  Clean up build files (build/, *.spec)? (y/n): ").strip().lower()
+    if ask:
+        response = input("[clean] Clean up build files (build/, *.spec)? Next build will be slower (y/n): ").strip().lower()
+    else:
+        response = 'y'
     
     if response == 'y':
         import shutil
@@ -94,67 +231,112 @@ def cleanup():
         # Remove build directory
         build_dir = current_dir / "build"
         if build_dir.exists():
-            shutil.rmtree(build_dir)
-            print("✓ Removed build/ directory")
+            try:
+                shutil.rmtree(build_dir)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"[warn] Could not remove build/: {e}")
+            
+            if build_dir.exists():
+                left = ", ".join(sorted(entry.name for entry in os.scandir(build_dir)))
+                print(f"[warn] build/ was not fully removed, still there: {left or '(empty directory)'}")
+            else:
+                print("[ok] Removed build/ directory")
         
         # Remove .spec file
         spec_file = current_dir / "QuadricSurfaces.spec"
-        if spec_file.exists():
+        try:
             spec_file.unlink()
-            print("✓ Removed .spec file")
+            print("[ok] Removed .spec file")
+        except FileNotFoundError:
+            pass
         
-        print("✓ Cleanup complete")
+        print("[ok] Cleanup complete")
     else:
-        print("ℹ️  Build files kept (you can delete them manually later)")
+        print("[info] Build files kept (you can delete them manually later)")
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Build the Quadric Surfaces Visualizer executable")
+    parser.add_argument("--onefile", action="store_true",
+                        help="build a single .exe instead of a folder (slower to start)")
+    parser.add_argument("--compress", action="store_true",
+                        help="allow UPX compression if UPX is on PATH (smaller, slower to start)")
+    parser.add_argument("--clean", action="store_true",
+                        help="remove build/ and the .spec file after building without asking")
+    parser.add_argument("--install-pyinstaller", action="store_true",
+                        help="install PyInstaller without asking if it is missing")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="do not ask any questions")
+    return parser.parse_args(argv)
+
+def main(args=None):
+    if args is None:
+        args = parse_args()
+    
     print("=" * 60)
     print("  Quadric Surfaces Visualizer - Executable Builder")
     print("=" * 60)
     
     # Check Python version
-    print(f"\n🐍 Python version: {sys.version}")
-    print(f"📁 Working directory: {Path(__file__).parent}")
+    print(f"\n[info] Python version: {sys.version}")
+    print(f"[info] Working directory: {os.path.dirname(os.path.abspath(__file__))}")
     
     # Check if PyInstaller is installed
     if not check_pyinstaller():
-        response = input("\nInstall PyInstaller now? (y/n): ").strip().lower()
+        if args.install_pyinstaller:
+            response = 'y'
+        elif args.yes:
+            response = 'n'
+        else:
+            response = input("\nInstall PyInstaller now? (y/n): ").strip().lower()
         if response == 'y':
             if not install_pyinstaller():
-                print("\n✗ Cannot proceed without PyInstaller")
+                print("\n[err] Cannot proceed without PyInstaller")
                 return 1
         else:
-            print("\n✗ PyInstaller is required to build executable")
+            print("\n[err] PyInstaller is required to build executable")
             return 1
     
     # Build executable
-    print("\n" + "=" * 60)
-    response = input("Start building executable? (y/n): ").strip().lower()
-    
-    if response != 'y':
-        print("Build cancelled")
-        return 0
+    if not args.yes:
+        print("\n" + "=" * 60)
+        response = input("Start building executable? (y/n): ").strip().lower()
+        
+        if response != 'y':
+            print("Build cancelled")
+            return 0
     
-    if build_exe():
-        cleanup()
+    if build_exe(onefile=args.onefile, compress=args.compress):
+        if args.clean:
+            cleanup(ask=False)
+        elif not args.yes:
+            cleanup()
         print("\n" + "=" * 60)
-        print("✅ All done! You can now run:")
-        print("   .\\dist\\QuadricSurfaces.exe")
+        print("[ok] All done! You can now run:")
+        if args.onefile:
+            print("   .\\dist\\QuadricSurfaces.exe")
+        else:
+            print("   .\\dist\\QuadricSurfaces\\QuadricSurfaces.exe")
         print("=" * 60)
         return 0
     else:
-        print("\n✗ Build failed")
+        print("\n[err] Build failed")
         return 1
 
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        exit_code = main()
-        input("\nPress Enter to exit...")
+        exit_code = main(args)
+        if not args.yes:
+            input("\nPress Enter to exit...")
         sys.exit(exit_code)
     except KeyboardInterrupt:
-        print("\n\n⚠️  Build cancelled by user")
+        print("\n\n[warn] Build cancelled by user")
         sys.exit(1)
     except Exception as e:
-        print(f"\n✗ Fatal error: {e}")
-        input("\nPress Enter to exit...")
+        print(f"\n[err] Fatal error: {e}")
+        if not args.yes:
+            input("\nPress Enter to exit...")
         sys.exit(1)
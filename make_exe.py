@@ -1,27 +1,12 @@
 """
 Quick build script - Just run this to create exe
+Shortcut for: python build_executable.py --yes
 """
-import subprocess
 import sys
 
-print("Building QuadricSurfaces.exe...")
-print("-" * 50)
+from build_executable import main, parse_args
 
-try:
-    subprocess.run([
-        sys.executable, "-m", "PyInstaller",
-        "--onefile",
-        "--windowed", 
-        "--name=QuadricSurfaces",
-        "--clean",
-        "quadric_surfaces.py"
-    ], check=True)
-    
-    print("-" * 50)
-    print("SUCCESS! Executable created at: dist\\QuadricSurfaces.exe")
-    print("-" * 50)
-    
-except Exception as e:
-    print(f"ERROR: {e}")
-    
-input("\nPress Enter to close...")
+if __name__ == "__main__":
+    exit_code = main(parse_args(["--yes"]))
+    input("\nPress Enter to close...")
+    sys.exit(exit_code)
@@ -4,12 +4,310 @@ Design an interactive Python program that visualizes and classifies all standard
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from mpl_toolkits.mplot3d import Axes3D
 import tkinter as tk
 from tkinter import ttk, messagebox
-import random
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Meshes are float32: plenty for drawing and half the memory traffic
+# through plot_surface
+MESH_DTYPE = np.float32
+
+# Lowest mesh resolution worth drawing, whatever the quality setting
+MIN_RENDER_RES = 16
+
+# Points along each ellipsoid trace
+TRACE_SAMPLES = 80
+
+# Coordinate indices (x, y, z = 0, 1, 2) for each orientation: the two
+# cross-section axes first, then the axis of symmetry
+AXIS_ORDER = {"z-axis": (0, 1, 2), "y-axis": (0, 2, 1), "x-axis": (1, 2, 0)}
+AXIS_NAMES = "xyz"
+
+# Bounds for Randomize, in the order a, b, c, p
+RANDOM_LOW = np.array([1, 1, 1, 0.5])
+RANDOM_HIGH = np.array([10, 10, 10, 5])
+
+# Unit half-axes from the origin along ±x, ±y, ±z; draw_axes scales them
+AXIS_SEGMENTS = np.array([
+    [(0, 0, 0), (1, 0, 0)], [(0, 0, 0), (-1, 0, 0)],
+    [(0, 0, 0), (0, 1, 0)], [(0, 0, 0), (0, -1, 0)],
+    [(0, 0, 0), (0, 0, 1)], [(0, 0, 0), (0, 0, -1)],
+], dtype=float)
+
+# How often the Tk loop checks for a finished mesh, in milliseconds
+PLOT_POLL_MS = 10
+
+# Equation of each surface, keyed by (surface type, cylinder type). t1, t2
+# and t3 are the squared terms from _square_terms, and axis and center the
+# axis of symmetry and its offset; the other fields are the parameters.
+EQUATIONS = {
+    (1, None): "(x-{h})²/{a}² + (y-{k})²/{b}² + (z-{l})²/{c}² = 1",
+    (2, None): "{t1} + {t2} - {t3} = 0",
+    (3, None): "{t1} + {t2} - {t3} = 1",
+    (4, None): "-{t1} - {t2} + {t3} = 1",
+    (5, None): "{t1} + {t2} = {axis}-{center}",
+    (6, None): "{t2} - {t1} = {axis}-{center}",
+    (7, "Elliptic"): "(x-{h})²/{a}² + (y-{k})²/{b}² = 1",
+    (7, "Hyperbolic"): "(x-{h})²/{a}² - (y-{k})²/{b}² = 1",
+    (7, "Parabolic"): "(y-{k})² = 4·{p}·(x-{h})",
+}
+
+# Description of each surface, keyed like EQUATIONS and filled in with the
+# parameters and orientation
+DESCRIPTIONS = {
+    (1, None): ("Closed surface, symmetric in all coordinate directions\n"
+                "Intercepts: x-axis: ±{a}, y-axis: ±{b}, z-axis: ±{c}"),
+    (2, None): "Double cone, vertex at ({h}, {k}, {l}), opens along {orientation}",
+    (3, None): "Single-sheeted hyperboloid, connected surface, opens along {orientation}",
+    (4, None): "Two-sheeted hyperboloid, disconnected surface, opens along {orientation}",
+    (5, None): "Elliptic paraboloid, opens along {orientation}, bowl-shaped",
+    (6, None): "Hyperbolic paraboloid (saddle surface), opens along {orientation}",
+    (7, "Elliptic"): "Elliptic cylinder, infinite along z-axis",
+    (7, "Hyperbolic"): "Hyperbolic cylinder, two separate sheets, infinite along z-axis",
+    (7, "Parabolic"): "Parabolic cylinder, infinite along z-axis",
+}
+
+
+# Sampling tables depend only on the resolution, so they are computed once
+# and shared by every plot. They are read-only because the cache hands out
+# the same arrays on each call.
+
+def _read_only(*arrays):
+    for arr in arrays:
+        arr.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=16)
+def _span(start, stop, num):
+    """Evenly spaced samples on [start, stop]"""
+    return _read_only(np.linspace(start, stop, num, dtype=MESH_DTYPE))[0]
+
+
+@lru_cache(maxsize=16)
+def _angles(res):
+    """cos and sin of res angles on [0, 2π]"""
+    u = _span(0, 2 * np.pi, res)
+    return _read_only(np.cos(u), np.sin(u))
+
+
+@lru_cache(maxsize=16)
+def _uv_sphere(res):
+    """cos/sin of the azimuth u on [0, 2π] and the polar angle v on [0, π]"""
+    cos_u, sin_u = _angles(res)
+    v = _span(0, np.pi, res)
+    return (cos_u, sin_u) + _read_only(np.cos(v), np.sin(v))
+
+
+@lru_cache(maxsize=16)
+def _uv_hyper(start, stop, num):
+    """cosh and sinh of num samples on [start, stop]"""
+    v = _span(start, stop, num)
+    return _read_only(np.cosh(v), np.sinh(v))
+
+
+def _grid(scale, rows, cols, offset):
+    """scale * outer(rows, cols) + offset, built in a single allocation.
+
+    The scale is applied to the short rows vector and the offset is added in
+    place, so no full-size temporaries are created along the way.
+    """
+    out = np.multiply.outer(scale * rows, cols)
+    out += offset
+    return out
+
+
+def _row_grid(values, n):
+    """n copies of the row vector values, as a read-only broadcast view"""
+    return np.broadcast_to(values, (n, values.size))
+
+
+def _col_grid(values, n):
+    """values as a column repeated n times, as a read-only broadcast view"""
+    return np.broadcast_to(values[:, np.newaxis], (values.size, n))
+
+
+def _orient(orientation, first, second, axial):
+    """Arrange the two cross-section grids and the axial grid as X, Y, Z"""
+    grids = [None, None, None]
+    for axis, grid in zip(AXIS_ORDER[orientation], (first, second, axial)):
+        grids[axis] = grid
+    return grids
+
+
+def _square_terms(orientation, scale, offset):
+    """The '(x-h)²/a²' equation terms, in AXIS_ORDER for the orientation"""
+    return [f"({AXIS_NAMES[axis]}-{offset[axis]})²/{scale[axis]}²"
+            for axis in AXIS_ORDER[orientation]]
+
+
+# Surface builders. They hold no state and touch neither Tk nor matplotlib,
+# so they are plain functions run on the mesh worker thread. Each returns its
+# meshes as a list of (X, Y, Z, cmap) tuples.
+
+def _generate_ellipsoid(a, b, c, p, h, k, l, orientation, res):
+    cos_u, sin_u, cos_v, sin_v = _uv_sphere(res)
+
+    X = _grid(a, cos_u, sin_v, h)
+    Y = _grid(b, sin_u, sin_v, k)
+    Z = _row_grid(c * cos_v + l, res)
+
+    return [(X, Y, Z, 'viridis')]
+
+
+def _generate_elliptic_cone(a, b, c, p, h, k, l, orientation, res):
+    v = _span(-2, 2, res)
+    # Trig lives on the 1D vectors; outer products build the grids
+    cu, su = _angles(res)
+    scale, offset = (a, b, c), (h, k, l)
+    i, j, m = AXIS_ORDER[orientation]
+
+    X, Y, Z = _orient(orientation,
+                      _grid(scale[i], v, cu, offset[i]),
+                      _grid(scale[j], v, su, offset[j]),
+                      _col_grid(scale[m] * v + offset[m], res))
+    return [(X, Y, Z, 'plasma')]
+
+
+def _generate_hyperboloid_one_sheet(a, b, c, p, h, k, l, orientation, res):
+    cu, su = _angles(res)
+    chv, shv = _uv_hyper(-2, 2, res)
+    scale, offset = (a, b, c), (h, k, l)
+    i, j, m = AXIS_ORDER[orientation]
+
+    X, Y, Z = _orient(orientation,
+                      _grid(scale[i], chv, cu, offset[i]),
+                      _grid(scale[j], chv, su, offset[j]),
+                      _col_grid(scale[m] * shv + offset[m], res))
+    return [(X, Y, Z, 'coolwarm')]
+
+
+def _generate_hyperboloid_two_sheets(a, b, c, p, h, k, l, orientation, res):
+    # Both sheets share the same cosh/sinh evaluations
+    cu, su = _angles(res)
+    chv, shv = _uv_hyper(0.1, 2, res)
+    scale, offset = (a, b, c), (h, k, l)
+    i, j, m = AXIS_ORDER[orientation]
+
+    first = _grid(scale[i], shv, cu, offset[i])
+    second = _grid(scale[j], shv, su, offset[j])
+    w1 = scale[m] * chv + offset[m]
+    w2 = 2 * offset[m] - w1  # Mirror of the first sheet about the center
+    meshes = [(*_orient(orientation, first, second, _col_grid(w1, res)), 'autumn'),
+              (*_orient(orientation, first, second, _col_grid(w2, res)), 'winter')]
+    return meshes
+
+
+def _generate_elliptic_paraboloid(a, b, c, p, h, k, l, orientation, res):
+    u = _span(-2, 2, res)
+    scale, offset = (a, b, c), (h, k, l)
+    i, j, m = AXIS_ORDER[orientation]
+    # U runs along columns and V along rows over the same samples, so
+    # the in-plane grids are broadcast views of u instead of a meshgrid.
+    # U² + V², squared once on the 1D samples and summed in one pass
+    sq = u * u
+    W = np.add.outer(sq, sq)
+    W += offset[m]
+
+    X, Y, Z = _orient(orientation,
+                      _row_grid(scale[i] * u + offset[i], res),
+                      _col_grid(scale[j] * u + offset[j], res),
+                      W)
+    return [(X, Y, Z, 'Spectral')]
+
+
+def _generate_hyperbolic_paraboloid(a, b, c, p, h, k, l, orientation, res):
+    u = _span(-2, 2, res)
+    scale, offset = (a, b, c), (h, k, l)
+    i, j, m = AXIS_ORDER[orientation]
+    # In-plane grids are broadcast views of u, as for the elliptic one.
+    # V² - U², squared once on the 1D samples and differenced in one pass
+    sq = u * u
+    W = np.subtract.outer(sq, sq)
+    W += offset[m]
+
+    X, Y, Z = _orient(orientation,
+                      _row_grid(scale[i] * u + offset[i], res),
+                      _col_grid(scale[j] * u + offset[j], res),
+                      W)
+    return [(X, Y, Z, 'RdYlBu')]
+
+
+# Every cylinder runs along z with the same heights: the profile curve
+# varies along columns and the height along rows, so each grid is one 1D
+# evaluation broadcast over the other direction
+
+def _cylinder_heights(l, res, cols):
+    """res cylinder heights down the rows, repeated over cols columns"""
+    return _col_grid(_span(-5, 5, res) + l, cols)
+
+
+def _generate_elliptic_cylinder(a, b, c, p, h, k, l, orientation, res):
+    cos_t, sin_t = _angles(res)
+    X = _row_grid(a * cos_t + h, res)
+    Y = _row_grid(b * sin_t + k, res)
+    return [(X, Y, _cylinder_heights(l, res, res), 'ocean')]
+
+
+def _generate_hyperbolic_cylinder(a, b, c, p, h, k, l, orientation, res):
+    cosh_t, sinh_t = _uv_hyper(-2, 2, res)
+    x1 = a * cosh_t + h
+    y1 = b * sinh_t + k
+    # Second branch is the first reflected through the center. Both share a
+    # colormap, so they go into one mesh split by a NaN column, which mplot3d
+    # leaves undrawn: one artist, not two
+    gap = np.full(1, np.nan, dtype=MESH_DTYPE)
+    X = _row_grid(np.concatenate([x1, gap, 2 * h - x1]), res)
+    Y = _row_grid(np.concatenate([y1, gap, 2 * k - y1]), res)
+    return [(X, Y, _cylinder_heights(l, res, X.shape[1]), 'copper')]
+
+
+def _generate_parabolic_cylinder(a, b, c, p, h, k, l, orientation, res):
+    y_vals = _span(-3, 3, res)
+    Y = _row_grid(y_vals, res)
+    # x = (y-k)²/(4p) + h, with the reciprocal hoisted out of the samples
+    dy = y_vals - k
+    X = _row_grid(dy * dy * (1 / (4 * p)) + h, res)
+    return [(X, Y, _cylinder_heights(l, res, res), 'ocean')]
+
+
+# Builder for each surface, keyed like EQUATIONS. All take the same
+# arguments, whether or not they use them, so one call dispatches to any.
+SURFACE_BUILDERS = {
+    (1, None): _generate_ellipsoid,
+    (2, None): _generate_elliptic_cone,
+    (3, None): _generate_hyperboloid_one_sheet,
+    (4, None): _generate_hyperboloid_two_sheets,
+    (5, None): _generate_elliptic_paraboloid,
+    (6, None): _generate_hyperbolic_paraboloid,
+    (7, "Elliptic"): _generate_elliptic_cylinder,
+    (7, "Hyperbolic"): _generate_hyperbolic_cylinder,
+    (7, "Parabolic"): _generate_parabolic_cylinder,
+}
+
+
+def _generate_surface(surface_type, orientation, cyl_type, params, res):
+    """Compute the meshes and the equation text for the chosen surface"""
+    a, b, c, p = params['a'], params['b'], params['c'], params['p']
+    h, k, l = params['h'], params['k'], params['l']
+
+    key = surface_type, cyl_type
+    meshes = SURFACE_BUILDERS[key](a, b, c, p, h, k, l, orientation, res)
+
+    # Equations and descriptions are stored once as templates and only the
+    # chosen one is filled: the squared terms and the axis of symmetry come
+    # from AXIS_ORDER, the rest straight from the parameters
+    scale, offset = (a, b, c), (h, k, l)
+    t1, t2, t3 = _square_terms(orientation, scale, offset)
+    axial = AXIS_ORDER[orientation][2]
+    # One mapping serves both templates
+    fields = dict(params, t1=t1, t2=t2, t3=t3, axis=AXIS_NAMES[axial],
+                  center=offset[axial], orientation=orientation)
+    equation = EQUATIONS[key].format_map(fields)
+    description = DESCRIPTIONS[key].format_map(fields)
+    return meshes, f"Equation: {equation}\nDescription: {description}"
 
 
 class QuadricSurfaceVisualizer:
@@ -35,6 +333,41 @@ class QuadricSurfaceVisualizer:
         # Quality settings for performance
         self.quality_level = 50  # Lower = faster, Higher = smoother
         
+        self._rng = np.random.default_rng()
+        
+        # Coordinate axes, trace and center marker artists, reused across
+        # plots (see draw_axes, plot_traces_ellipsoid and mark_center)
+        self._axes_lines = None
+        self._axes_length = None
+        self._traces = None
+        self._trace_handles = []
+        self._center = None
+        # Legend of the last plot and the handles it lists; rebuilt only
+        # when those change (ellipsoid traces come and go)
+        self._legend = None
+        self._legend_entries = None
+        
+        # Artists owned by the current plot; clear_plot removes just these
+        # so the axes themselves are built once and reused
+        self._dynamic_artists = []
+        self._legend_handles = []
+        
+        # Meshes are computed off the Tk thread; _plot_job is a token for the
+        # latest request, so results of superseded ones are dropped
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._plot_job = None
+        
+        # Inputs of the last mesh computation and its job
+        self._mesh_key = None
+        self._mesh_job = None
+        
+        # Figure, axes and canvas are built by setup_plot_area, after the
+        # controls are on screen; until then they are None
+        self.fig = None
+        self.ax = None
+        self.canvas = None
+        self._plot_frame = None
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -130,6 +463,14 @@ class QuadricSurfaceVisualizer:
             self.range_vars[rmax] = tk.StringVar(value="10")
             ttk.Entry(range_frame, textvariable=self.range_vars[rmax], width=8).grid(row=i, column=3, padx=2, sticky=(tk.W, tk.E))
         
+        # Every numeric entry in one place, so validate_inputs reads them
+        # in a single pass
+        self._numeric_vars = {
+            'a': self.a_var, 'b': self.b_var, 'c': self.c_var, 'p': self.p_var,
+            'h': self.h_var, 'k': self.k_var, 'l': self.l_var,
+            **self.range_vars
+        }
+        
         # Quality settings
         quality_frame = ttk.LabelFrame(control_frame, text="Rendering Quality", padding="10")
         quality_frame.grid(row=13, column=0, sticky=(tk.W, tk.E), pady=10)
@@ -176,22 +517,6 @@ class QuadricSurfaceVisualizer:
         right_frame = ttk.Frame(main_frame)
         right_frame.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
         
-        # 3D Plot
-        self.fig = plt.Figure(figsize=(10, 7), dpi=100)
-        self.ax = self.fig.add_subplot(111, projection='3d')
-        
-        # Enable better performance
-        self.ax.set_proj_type('persp')
-        
-        self.canvas = FigureCanvasTkAgg(self.fig, master=right_frame)
-        self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Add navigation toolbar for zoom/pan
-        toolbar_frame = ttk.Frame(right_frame)
-        toolbar_frame.grid(row=0, column=0, sticky=(tk.N, tk.W))
-        self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
-        self.toolbar.update()
-        
         # Analysis Results
         analysis_frame = ttk.LabelFrame(right_frame, text="📊 Analysis Results", padding="10")
         analysis_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=10)
@@ -211,6 +536,43 @@ class QuadricSurfaceVisualizer:
         right_frame.columnconfigure(0, weight=1)
         right_frame.rowconfigure(0, weight=1)
         
+        # matplotlib takes a noticeable moment to import, so the plot area
+        # is built once the controls are already on screen
+        self._plot_frame = right_frame
+        self.root.after_idle(self.setup_plot_area)
+    
+    def setup_plot_area(self):
+        if self.ax is not None:
+            return  # Already built, by the idle callback or an early plot
+        right_frame = self._plot_frame
+        
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        
+        # 3D Plot
+        self.fig = Figure(figsize=(10, 7), dpi=100)
+        self.ax = self.fig.add_subplot(111, projection='3d')
+        
+        # Enable better performance
+        self.ax.set_proj_type('persp')
+        
+        # Styling survives clear_plot, so it is applied once here
+        self.ax.set_xlabel('X', fontsize=11, fontweight='bold')
+        self.ax.set_ylabel('Y', fontsize=11, fontweight='bold')
+        self.ax.set_zlabel('Z', fontsize=11, fontweight='bold')
+        self.ax.set_facecolor('#f0f0f0')
+        self.fig.patch.set_facecolor('white')
+        self.ax.grid(True, linestyle='--', alpha=0.3, linewidth=0.5)
+        
+        self.canvas = FigureCanvasTkAgg(self.fig, master=right_frame)
+        self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Add navigation toolbar for zoom/pan
+        toolbar_frame = ttk.Frame(right_frame)
+        toolbar_frame.grid(row=0, column=0, sticky=(tk.N, tk.W))
+        self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
+        self.toolbar.update()
+    
     def on_surface_change(self):
         surface_type = self.surface_var.get()
         
@@ -228,36 +590,27 @@ class QuadricSurfaceVisualizer:
     
     def validate_inputs(self):
         try:
-            a = float(self.a_var.get())
-            b = float(self.b_var.get())
-            c = float(self.c_var.get())
-            p = float(self.p_var.get())
-            h = float(self.h_var.get())
-            k = float(self.k_var.get())
-            l = float(self.l_var.get())
-            
-            if a <= 0 or b <= 0 or c <= 0:
-                messagebox.showerror("Invalid Input", "Parameters a, b, c must be greater than 0!")
-                return None
-            
-            ranges = {}
-            for key, var in self.range_vars.items():
-                ranges[key] = float(var.get())
-            
-            return {
-                'a': a, 'b': b, 'c': c, 'p': p,
-                'h': h, 'k': k, 'l': l,
-                'ranges': ranges
-            }
+            values = {key: float(var.get()) for key, var in self._numeric_vars.items()}
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid numeric values!")
             return None
+        
+        if values['a'] <= 0 or values['b'] <= 0 or values['c'] <= 0:
+            messagebox.showerror("Invalid Input", "Parameters a, b, c must be greater than 0!")
+            return None
+        
+        values['ranges'] = {key: values.pop(key) for key in self.range_vars}
+        return values
     
     def randomize_parameters(self):
-        self.a_var.set(str(round(random.uniform(1, 10), 2)))
-        self.b_var.set(str(round(random.uniform(1, 10), 2)))
-        self.c_var.set(str(round(random.uniform(1, 10), 2)))
-        self.p_var.set(str(round(random.uniform(0.5, 5), 2)))
+        # a, b, c in [1, 10) and p in [0.5, 5), drawn in one call
+        values = self._rng.uniform(RANDOM_LOW, RANDOM_HIGH).round(2)
+        for var, value in zip((self.a_var, self.b_var, self.c_var, self.p_var), values):
+            var.set(str(float(value)))
+    
+    def render_resolution(self):
+        """Mesh samples per direction; plot_surface draws every one of them"""
+        return max(MIN_RENDER_RES, self.quality_level // 2)
     
     def set_quality(self, quality):
         """Set rendering quality level"""
@@ -265,89 +618,137 @@ class QuadricSurfaceVisualizer:
         self.root.update_idletasks()
     
     def clear_plot(self):
-        self.ax.clear()
-        self.canvas.draw()
+        self._plot_job = None  # Drop a plot still being computed
+        if self.ax is not None:  # Nothing is drawn before the plot area exists
+            self._clear_artists()
+        # Unlike a replot, Clear also hides the coordinate axes; draw_axes
+        # shows them again
+        if self._axes_lines is not None:
+            self._axes_lines.set_visible(False)
         self.analysis_text.delete(1.0, tk.END)
     
+    def _clear_artists(self):
+        # Remove only what the last plot added instead of ax.clear(), which
+        # tears down and rebuilds the whole 3D axes
+        for artist in self._dynamic_artists:
+            artist.remove()
+        self._dynamic_artists.clear()
+        self._legend_handles.clear()
+        for artist in (self._traces, self._center, self._legend):
+            if artist is not None:
+                artist.set_visible(False)
+        self.ax.set_title('')
+        self.canvas.draw_idle()
+    
+    def _show_analysis(self, text):
+        """Replace the analysis text, leaving the widget alone if it is unchanged"""
+        if self.analysis_text.get(1.0, 'end-1c') != text:
+            self.analysis_text.delete(1.0, tk.END)
+            self.analysis_text.insert(tk.END, text)
+    
     def plot_surface(self):
         params = self.validate_inputs()
         if params is None:
             return
+        # A plot requested before the idle callback ran builds the area itself
+        self.setup_plot_area()
         
-        self.clear_plot()
-        
+        # Each Tk variable is read once, and everything below works on
+        # these locals
         surface_type = self.surface_var.get()
         orientation = self.orientation_var.get()
+        cyl_type = self.cylinder_var.get() if surface_type == 7 else None
+        res = self.render_resolution()
         
         a, b, c, p = params['a'], params['b'], params['c'], params['p']
         h, k, l = params['h'], params['k'], params['l']
         ranges = params['ranges']
         
-        # Create meshgrid with adjustable quality
-        resolution = self.quality_level
-        x = np.linspace(ranges['xmin'], ranges['xmax'], resolution)
-        y = np.linspace(ranges['ymin'], ranges['ymax'], resolution)
-        z = np.linspace(ranges['zmin'], ranges['zmax'], resolution)
-        
-        analysis_info = f"--- Analysis Results ---\n"
-        analysis_info += f"Surface Type: {self.surface_types[surface_type]}\n"
-        
+        # Collected line by line and joined once
+        parameters = f"Parameters: a={a}, b={b}, c={c}"
+        if cyl_type == "Parabolic":
+            parameters += f", p={p}"
+        lines = ["--- Analysis Results ---",
+                 f"Surface Type: {self.surface_types[surface_type]}"]
         if surface_type == 7:
-            analysis_info += f"Cylinder Type: {self.cylinder_var.get()}\n"
-        
+            lines.append(f"Cylinder Type: {cyl_type}")
         if surface_type != 1:
-            analysis_info += f"Orientation: Along {orientation}\n"
+            lines.append(f"Orientation: Along {orientation}")
+        lines += [parameters,
+                  f"Center: ({h}, {k}, {l})",
+                  f"Range: x in [{ranges['xmin']}, {ranges['xmax']}], "
+                  f"y in [{ranges['ymin']}, {ranges['ymax']}], "
+                  f"z in [{ranges['zmin']}, {ranges['zmax']}]",
+                  ""]  # Keeps the trailing newline before the equation
+        analysis_info = "\n".join(lines)
+        
+        # Meshes are built on the worker thread; matplotlib and Tk are only
+        # touched from the main loop, in _finish_plot. Replotting the same
+        # surface (e.g. after changing only the visible range) reuses them.
+        mesh_key = (surface_type, orientation, cyl_type, res, a, b, c, p, h, k, l)
+        if mesh_key != self._mesh_key:
+            self._mesh_key = mesh_key
+            self._mesh_job = self._pool.submit(_generate_surface, surface_type,
+                                               orientation, cyl_type, params, res)
+        # Requests that share a mesh job still need telling apart, so each
+        # one gets its own token
+        token = object()
+        self._plot_job = token
+        self._poll_plot(token, self._mesh_job, surface_type, params, analysis_info)
+    
+    def _poll_plot(self, token, job, *args):
+        if token is not self._plot_job:
+            return  # Superseded by a newer plot, or cleared
+        if job.done():
+            self._finish_plot(job, *args)
+        else:
+            self.root.after(PLOT_POLL_MS, self._poll_plot, token, job, *args)
+    
+    def _finish_plot(self, job, surface_type, params, analysis_info):
+        self._plot_job = None
+        # The analysis text is kept: replotting the same surface (e.g. with a
+        # new range only) usually produces the same text again
+        self._clear_artists()
+        
+        a, b, c = params['a'], params['b'], params['c']
+        h, k, l = params['h'], params['k'], params['l']
         
-        analysis_info += f"Parameters: a={a}, b={b}, c={c}"
-        if surface_type == 7 and self.cylinder_var.get() == "Parabolic":
-            analysis_info += f", p={p}"
-        analysis_info += f"\nCenter: ({h}, {k}, {l})\n"
-        analysis_info += f"Range: x in [{ranges['xmin']}, {ranges['xmax']}], "
-        analysis_info += f"y in [{ranges['ymin']}, {ranges['ymax']}], "
-        analysis_info += f"z in [{ranges['zmin']}, {ranges['zmax']}]\n"
+        # Draw coordinate axes first: this also resets the data limits left
+        # over from the previous plot
+        self.draw_axes(params['ranges'])
         
+        analysis = ''
         try:
+            meshes, equation = job.result()
+            # Sampled at the drawn resolution, so rcount/ccount never resample
+            for X, Y, Z, cmap in meshes:
+                rows, cols = X.shape
+                surface = self.ax.plot_surface(X, Y, Z, cmap=cmap, alpha=0.8,
+                                              rcount=rows, ccount=cols,
+                                              linewidth=0, antialiased=True, shade=True)
+                self._dynamic_artists.append(surface)
+            analysis = analysis_info + equation
+            self._show_analysis(analysis)
+            
             if surface_type == 1:
-                self.plot_ellipsoid(a, b, c, h, k, l, analysis_info)
-            elif surface_type == 2:
-                self.plot_elliptic_cone(a, b, c, h, k, l, orientation, analysis_info)
-            elif surface_type == 3:
-                self.plot_hyperboloid_one_sheet(a, b, c, h, k, l, orientation, analysis_info)
-            elif surface_type == 4:
-                self.plot_hyperboloid_two_sheets(a, b, c, h, k, l, orientation, analysis_info)
-            elif surface_type == 5:
-                self.plot_elliptic_paraboloid(a, b, c, h, k, l, orientation, analysis_info)
-            elif surface_type == 6:
-                self.plot_hyperbolic_paraboloid(a, b, c, h, k, l, orientation, analysis_info)
-            elif surface_type == 7:
-                cyl_type = self.cylinder_var.get()
-                self.plot_cylinder(a, b, c, p, h, k, l, cyl_type, orientation, analysis_info)
+                self.plot_traces_ellipsoid(a, b, c, h, k, l)
         except Exception as e:
+            self._show_analysis(analysis)  # Empty unless the surface was drawn
             messagebox.showerror("Plot Error", f"Error plotting surface: {str(e)}")
             return
         
-        # Set labels and title with better styling
-        self.ax.set_xlabel('X', fontsize=11, fontweight='bold')
-        self.ax.set_ylabel('Y', fontsize=11, fontweight='bold')
-        self.ax.set_zlabel('Z', fontsize=11, fontweight='bold')
+        # Set title with better styling
         self.ax.set_title(f"{self.surface_types[surface_type]}", 
                          fontsize=13, fontweight='bold', pad=15)
         
-        # Set background color for better contrast
-        self.ax.set_facecolor('#f0f0f0')
-        self.fig.patch.set_facecolor('white')
-        
-        # Grid styling
-        self.ax.grid(True, linestyle='--', alpha=0.3, linewidth=0.5)
-        
-        # Draw coordinate axes
-        self.draw_axes(ranges)
-        
-        # Mark center with better visibility
-        self.ax.scatter([h], [k], [l], color='red', s=150, marker='o', 
-                       edgecolors='darkred', linewidths=2, label='Center', 
-                       alpha=0.9, zorder=100)
-        self.ax.legend(loc='upper right', fontsize=9)
+        center = self.mark_center(h, k, l)
+        handles = self._legend_handles + [center]
+        if handles != self._legend_entries:
+            if self._legend is not None:
+                self._legend.remove()
+            self._legend = self.ax.legend(handles=handles, loc='upper right', fontsize=9)
+            self._legend_entries = handles
+        self._legend.set_visible(True)
         
         # Set equal aspect ratio if possible
         try:
@@ -355,281 +756,78 @@ class QuadricSurfaceVisualizer:
         except:
             pass
         
-        self.canvas.draw()
-    
-    def plot_ellipsoid(self, a, b, c, h, k, l, analysis_info):
-        res = self.quality_level
-        u = np.linspace(0, 2 * np.pi, res)
-        v = np.linspace(0, np.pi, res)
-        
-        X = a * np.outer(np.cos(u), np.sin(v)) + h
-        Y = b * np.outer(np.sin(u), np.sin(v)) + k
-        Z = c * np.outer(np.ones(np.size(u)), np.cos(v)) + l
-        
-        # Use rcount and ccount for better performance
-        self.ax.plot_surface(X, Y, Z, cmap='viridis', alpha=0.8, 
-                            rcount=res//2, ccount=res//2, 
-                            linewidth=0, antialiased=True, shade=True)
-        
-        equation = f"Equation: (x-{h})²/{a}² + (y-{k})²/{b}² + (z-{l})²/{c}² = 1\n"
-        description = "Description: Closed surface, symmetric in all coordinate directions\n"
-        description += f"Intercepts: x-axis: ±{a}, y-axis: ±{b}, z-axis: ±{c}"
-        
-        self.analysis_text.insert(tk.END, analysis_info + equation + description)
-        
-        # Plot traces
-        self.plot_traces_ellipsoid(a, b, c, h, k, l)
+        # Coalesces with the draw_idle from _clear_artists into a single render
+        self.canvas.draw_idle()
     
-    def plot_elliptic_cone(self, a, b, c, h, k, l, orientation, analysis_info):
-        res = self.quality_level
-        u = np.linspace(0, 2 * np.pi, res)
-        v = np.linspace(-2, 2, res)
-        U, V = np.meshgrid(u, v)
-        
-        if orientation == "z-axis":
-            X = a * V * np.cos(U) + h
-            Y = b * V * np.sin(U) + k
-            Z = c * V + l
-            equation = f"Equation: (x-{h})²/{a}² + (y-{k})²/{b}² - (z-{l})²/{c}² = 0"
-        elif orientation == "y-axis":
-            X = a * V * np.cos(U) + h
-            Z = c * V * np.sin(U) + l
-            Y = b * V + k
-            equation = f"Equation: (x-{h})²/{a}² + (z-{l})²/{c}² - (y-{k})²/{b}² = 0"
-        else:  # x-axis
-            Y = b * V * np.cos(U) + k
-            Z = c * V * np.sin(U) + l
-            X = a * V + h
-            equation = f"Equation: (y-{k})²/{b}² + (z-{l})²/{c}² - (x-{h})²/{a}² = 0"
-        
-        self.ax.plot_surface(X, Y, Z, cmap='plasma', alpha=0.8, 
-                            rcount=res//2, ccount=res//2,
-                            linewidth=0, antialiased=True, shade=True)
-        
-        description = f"\nDescription: Double cone, vertex at ({h}, {k}, {l}), opens along {orientation}"
-        self.analysis_text.insert(tk.END, analysis_info + equation + description)
-    
-    def plot_hyperboloid_one_sheet(self, a, b, c, h, k, l, orientation, analysis_info):
-        res = self.quality_level
-        u = np.linspace(0, 2 * np.pi, res)
-        v = np.linspace(-2, 2, res)
-        U, V = np.meshgrid(u, v)
-        
-        if orientation == "z-axis":
-            X = a * np.cosh(V) * np.cos(U) + h
-            Y = b * np.cosh(V) * np.sin(U) + k
-            Z = c * np.sinh(V) + l
-            equation = f"Equation: (x-{h})²/{a}² + (y-{k})²/{b}² - (z-{l})²/{c}² = 1"
-        elif orientation == "y-axis":
-            X = a * np.cosh(V) * np.cos(U) + h
-            Z = c * np.cosh(V) * np.sin(U) + l
-            Y = b * np.sinh(V) + k
-            equation = f"Equation: (x-{h})²/{a}² + (z-{l})²/{c}² - (y-{k})²/{b}² = 1"
-        else:  # x-axis
-            Y = b * np.cosh(V) * np.cos(U) + k
-            Z = c * np.cosh(V) * np.sin(U) + l
-            X = a * np.sinh(V) + h
-            equation = f"Equation: (y-{k})²/{b}² + (z-{l})²/{c}² - (x-{h})²/{a}² = 1"
-        
-        self.ax.plot_surface(X, Y, Z, cmap='coolwarm', alpha=0.8,
-                            rcount=res//2, ccount=res//2,
-                            linewidth=0, antialiased=True, shade=True)
-        
-        description = f"\nDescription: Single-sheeted hyperboloid, connected surface, opens along {orientation}"
-        self.analysis_text.insert(tk.END, analysis_info + equation + description)
-    
-    def plot_hyperboloid_two_sheets(self, a, b, c, h, k, l, orientation, analysis_info):
-        res = self.quality_level
-        u = np.linspace(0, 2 * np.pi, res)
-        v = np.linspace(0.1, 2, res//2)
-        U, V = np.meshgrid(u, v)
-        
-        if orientation == "z-axis":
-            X = a * np.sinh(V) * np.cos(U) + h
-            Y = b * np.sinh(V) * np.sin(U) + k
-            Z1 = c * np.cosh(V) + l
-            Z2 = -c * np.cosh(V) + l
-            equation = f"Equation: -(x-{h})²/{a}² - (y-{k})²/{b}² + (z-{l})²/{c}² = 1"
-        elif orientation == "y-axis":
-            X = a * np.sinh(V) * np.cos(U) + h
-            Z = c * np.sinh(V) * np.sin(U) + l
-            Y1 = b * np.cosh(V) + k
-            Y2 = -b * np.cosh(V) + k
-            equation = f"Equation: -(x-{h})²/{a}² - (z-{l})²/{c}² + (y-{k})²/{b}² = 1"
-        else:  # x-axis
-            Y = b * np.sinh(V) * np.cos(U) + k
-            Z = c * np.sinh(V) * np.sin(U) + l
-            X1 = a * np.cosh(V) + h
-            X2 = -a * np.cosh(V) + h
-            equation = f"Equation: -(y-{k})²/{b}² - (z-{l})²/{c}² + (x-{h})²/{a}² = 1"
-        
-        # Plot both sheets
-        res = self.quality_level
-        if orientation == "z-axis":
-            self.ax.plot_surface(X, Y, Z1, cmap='autumn', alpha=0.8,
-                                rcount=res//2, ccount=res//2,
-                                linewidth=0, antialiased=True, shade=True)
-            self.ax.plot_surface(X, Y, Z2, cmap='winter', alpha=0.8,
-                                rcount=res//2, ccount=res//2,
-                                linewidth=0, antialiased=True, shade=True)
-        elif orientation == "y-axis":
-            self.ax.plot_surface(X, Y1, Z, cmap='autumn', alpha=0.8,
-                                rcount=res//2, ccount=res//2,
-                                linewidth=0, antialiased=True, shade=True)
-            self.ax.plot_surface(X, Y2, Z, cmap='winter', alpha=0.8,
-                                rcount=res//2, ccount=res//2,
-                                linewidth=0, antialiased=True, shade=True)
+    def plot_traces_ellipsoid(self, a, b, c, h, k, l):
+        from matplotlib.lines import Line2D
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
+        
+        # The three principal traces share one artist; cos/sin come from
+        # the same cached table as the meshes. They are written straight
+        # into one (trace, point, xyz) array, the fixed coordinate of each
+        # plane by scalar fill.
+        cos_t, sin_t = _angles(TRACE_SAMPLES)
+        segments = np.empty((3, TRACE_SAMPLES, 3), dtype=MESH_DTYPE)
+        xy, xz, yz = segments
+        xy[:, 0] = xz[:, 0] = a * cos_t + h
+        xy[:, 1] = b * sin_t + k
+        xy[:, 2] = l
+        xz[:, 1] = k
+        xz[:, 2] = yz[:, 2] = c * sin_t + l
+        yz[:, 0] = h
+        yz[:, 1] = b * cos_t + k
+        
+        # Created on first use, then only re-segmented for each ellipsoid
+        if self._traces is None:
+            colors = ['r', 'b', 'g']
+            self._traces = Line3DCollection(segments, colors=colors,
+                                            linewidths=2.5, alpha=0.9)
+            self.ax.add_collection3d(self._traces)
+            # A collection gets a single legend entry, so each trace is
+            # listed through a proxy line
+            self._trace_handles = [Line2D([], [], color=color, linewidth=2.5, alpha=0.9,
+                                          label=f'{plane}-plane trace')
+                                   for color, plane in zip(colors, ['XY', 'XZ', 'YZ'])]
         else:
-            self.ax.plot_surface(X1, Y, Z, cmap='autumn', alpha=0.8,
-                                rcount=res//2, ccount=res//2,
-                                linewidth=0, antialiased=True, shade=True)
-            self.ax.plot_surface(X2, Y, Z, cmap='winter', alpha=0.8,
-                                rcount=res//2, ccount=res//2,
-                                linewidth=0, antialiased=True, shade=True)
-        
-        description = f"\nDescription: Two-sheeted hyperboloid, disconnected surface, opens along {orientation}"
-        self.analysis_text.insert(tk.END, analysis_info + equation + description)
-    
-    def plot_elliptic_paraboloid(self, a, b, c, h, k, l, orientation, analysis_info):
-        res = self.quality_level
-        u = np.linspace(-2, 2, res)
-        v = np.linspace(-2, 2, res)
-        U, V = np.meshgrid(u, v)
-        
-        if orientation == "z-axis":
-            X = a * U + h
-            Y = b * V + k
-            Z = (U**2 + V**2) + l
-            equation = f"Equation: (x-{h})²/{a}² + (y-{k})²/{b}² = z-{l}"
-        elif orientation == "y-axis":
-            X = a * U + h
-            Z = c * V + l
-            Y = (U**2 + V**2) + k
-            equation = f"Equation: (x-{h})²/{a}² + (z-{l})²/{c}² = y-{k}"
-        else:  # x-axis
-            Y = b * U + k
-            Z = c * V + l
-            X = (U**2 + V**2) + h
-            equation = f"Equation: (y-{k})²/{b}² + (z-{l})²/{c}² = x-{h}"
-        
-        self.ax.plot_surface(X, Y, Z, cmap='Spectral', alpha=0.8,
-                            rcount=res//2, ccount=res//2,
-                            linewidth=0, antialiased=True, shade=True)
-        
-        description = f"\nDescription: Elliptic paraboloid, opens along {orientation}, bowl-shaped"
-        self.analysis_text.insert(tk.END, analysis_info + equation + description)
-    
-    def plot_hyperbolic_paraboloid(self, a, b, c, h, k, l, orientation, analysis_info):
-        res = self.quality_level
-        u = np.linspace(-2, 2, res)
-        v = np.linspace(-2, 2, res)
-        U, V = np.meshgrid(u, v)
-        
-        if orientation == "z-axis":
-            X = a * U + h
-            Y = b * V + k
-            Z = (V**2 - U**2) + l
-            equation = f"Equation: (y-{k})²/{b}² - (x-{h})²/{a}² = z-{l}"
-        elif orientation == "y-axis":
-            X = a * U + h
-            Z = c * V + l
-            Y = (V**2 - U**2) + k
-            equation = f"Equation: (z-{l})²/{c}² - (x-{h})²/{a}² = y-{k}"
-        else:  # x-axis
-            Y = b * U + k
-            Z = c * V + l
-            X = (V**2 - U**2) + h
-            equation = f"Equation: (z-{l})²/{c}² - (y-{k})²/{b}² = x-{h}"
-        
-        self.ax.plot_surface(X, Y, Z, cmap='RdYlBu', alpha=0.8,
-                            rcount=res//2, ccount=res//2,
-                            linewidth=0, antialiased=True, shade=True)
-        
-        description = f"\nDescription: Hyperbolic paraboloid (saddle surface), opens along {orientation}"
-        self.analysis_text.insert(tk.END, analysis_info + equation + description)
+            self._traces.set_segments(segments)
+            self._traces.set_visible(True)
+        self._legend_handles += self._trace_handles
     
-    def plot_cylinder(self, a, b, c, p, h, k, l, cyl_type, orientation, analysis_info):
-        res = self.quality_level
-        theta = np.linspace(0, 2 * np.pi, res)
-        z = np.linspace(-5, 5, res)
-        
-        if cyl_type == "Elliptic":
-            Theta, Z = np.meshgrid(theta, z)
-            X = a * np.cos(Theta) + h
-            Y = b * np.sin(Theta) + k
-            Z_plot = Z + l
-            equation = f"Equation: (x-{h})²/{a}² + (y-{k})²/{b}² = 1"
-            description = "\nDescription: Elliptic cylinder, infinite along z-axis"
-            
-        elif cyl_type == "Hyperbolic":
-            t = np.linspace(-2, 2, res)
-            z = np.linspace(-5, 5, res)
-            T, Z = np.meshgrid(t, z)
-            
-            X1 = a * np.cosh(T) + h
-            Y1 = b * np.sinh(T) + k
-            X2 = -a * np.cosh(T) + h
-            Y2 = -b * np.sinh(T) + k
-            Z_plot = Z + l
-            
-            self.ax.plot_surface(X1, Y1, Z_plot, cmap='copper', alpha=0.8,
-                                rcount=res//2, ccount=res//2,
-                                linewidth=0, antialiased=True, shade=True)
-            self.ax.plot_surface(X2, Y2, Z_plot, cmap='copper', alpha=0.8,
-                                rcount=res//2, ccount=res//2,
-                                linewidth=0, antialiased=True, shade=True)
-            
-            equation = f"Equation: (x-{h})²/{a}² - (y-{k})²/{b}² = 1"
-            description = "\nDescription: Hyperbolic cylinder, two separate sheets, infinite along z-axis"
-            self.analysis_text.insert(tk.END, analysis_info + equation + description)
-            return
-            
-        else:  # Parabolic
-            y_vals = np.linspace(-3, 3, res)
-            z = np.linspace(-5, 5, res)
-            Y, Z = np.meshgrid(y_vals, z)
-            X = (Y - k)**2 / (4 * p) + h
-            Z_plot = Z + l
-            equation = f"Equation: (y-{k})² = 4·{p}·(x-{h})"
-            description = "\nDescription: Parabolic cylinder, infinite along z-axis"
-        
-        self.ax.plot_surface(X, Y, Z_plot, cmap='ocean', alpha=0.8,
-                            rcount=res//2, ccount=res//2,
-                            linewidth=0, antialiased=True, shade=True)
-        self.analysis_text.insert(tk.END, analysis_info + equation + description)
-    
-    def plot_traces_ellipsoid(self, a, b, c, h, k, l):
-        # XY-plane trace (z = l)
-        theta = np.linspace(0, 2 * np.pi, 80)
-        x_trace = a * np.cos(theta) + h
-        y_trace = b * np.sin(theta) + k
-        z_trace = np.full_like(x_trace, l)
-        self.ax.plot(x_trace, y_trace, z_trace, 'r-', linewidth=2.5, label='XY-plane trace', alpha=0.9)
-        
-        # XZ-plane trace (y = k)
-        x_trace = a * np.cos(theta) + h
-        y_trace = np.full_like(x_trace, k)
-        z_trace = c * np.sin(theta) + l
-        self.ax.plot(x_trace, y_trace, z_trace, 'b-', linewidth=2.5, label='XZ-plane trace', alpha=0.9)
-        
-        # YZ-plane trace (x = h)
-        x_trace = np.full_like(theta, h)
-        y_trace = b * np.cos(theta) + k
-        z_trace = c * np.sin(theta) + l
-        self.ax.plot(x_trace, y_trace, z_trace, 'g-', linewidth=2.5, label='YZ-plane trace', alpha=0.9)
+    def mark_center(self, h, k, l):
+        # One marker, created on first use and moved to each new center
+        if self._center is None:
+            self._center = self.ax.scatter([h], [k], [l], color='red', s=150, marker='o',
+                                           edgecolors='darkred', linewidths=2, label='Center',
+                                           alpha=0.9, zorder=100)
+        else:
+            self._center._offsets3d = (np.array([h]), np.array([k]), np.array([l]))
+            self._center.set_visible(True)
+        return self._center
     
     def draw_axes(self, ranges):
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
+        
         # Draw coordinate axes
         axis_length = max(abs(ranges['xmax']), abs(ranges['xmin']),
                          abs(ranges['ymax']), abs(ranges['ymin']),
                          abs(ranges['zmax']), abs(ranges['zmin']))
         
-        self.ax.plot([0, axis_length], [0, 0], [0, 0], 'k--', alpha=0.3, linewidth=0.5)
-        self.ax.plot([0, -axis_length], [0, 0], [0, 0], 'k--', alpha=0.3, linewidth=0.5)
-        self.ax.plot([0, 0], [0, axis_length], [0, 0], 'k--', alpha=0.3, linewidth=0.5)
-        self.ax.plot([0, 0], [0, -axis_length], [0, 0], 'k--', alpha=0.3, linewidth=0.5)
-        self.ax.plot([0, 0], [0, 0], [0, axis_length], 'k--', alpha=0.3, linewidth=0.5)
-        self.ax.plot([0, 0], [0, 0], [0, -axis_length], 'k--', alpha=0.3, linewidth=0.5)
+        # One collection for all six half-axes, created once and only
+        # re-segmented when the axis length changes
+        if self._axes_lines is None:
+            self._axes_lines = Line3DCollection([], colors='k', linestyles='--',
+                                                alpha=0.3, linewidths=0.5)
+        if axis_length != self._axes_length:
+            self._axes_lines.set_segments(axis_length * AXIS_SEGMENTS)
+            self._axes_length = axis_length
+        if self._axes_lines.axes is not self.ax:
+            self.ax.add_collection3d(self._axes_lines)
+        self._axes_lines.set_visible(True)
+        # Start the data limits from the axes alone; everything plotted
+        # afterwards extends them, as it did after ax.clear()
+        self.ax.auto_scale_xyz([-axis_length, axis_length], [-axis_length, axis_length],
+                               [-axis_length, axis_length], had_data=False)
 
 
 def main():